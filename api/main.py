@@ -3,6 +3,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+import asyncio
+import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
@@ -46,10 +48,18 @@ except Exception as e:
 async def lifespan(app: FastAPI):
     """
     Lifespan event handler for the FastAPI application.
-    Runs database migrations automatically on startup.
+    Runs database migrations automatically on startup and manages the
+    shared auth-api proxy client.
     """
     # Startup: Run database migrations
     logger.info("Starting API initialization...")
+    loop_module = type(asyncio.get_running_loop()).__module__
+    logger.info(f"Event loop: {loop_module}")
+    if sys.platform != "win32" and not loop_module.startswith("uvloop"):
+        logger.warning(
+            "Running on the default asyncio event loop; start uvicorn with "
+            "--loop uvloop for better throughput"
+        )
 
     try:
         migration_manager = AsyncMigrationManager()
@@ -73,12 +83,16 @@ async def lifespan(app: FastAPI):
         # Fail fast - don't start the API with an outdated database schema
         raise RuntimeError(f"Failed to run database migrations: {str(e)}") from e
 
+    # Shared HTTP client for the /auth reverse proxy
+    app.state.auth_client = auth_proxy.create_auth_client()
+
     logger.success("API initialization completed successfully")
 
     # Yield control to the application
     yield
 
     # Shutdown: cleanup if needed
+    await app.state.auth_client.aclose()
     logger.info("API shutdown complete")
 
 
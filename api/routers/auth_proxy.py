@@ -7,67 +7,102 @@ so that the auth-api is reachable through the single Render port (15055).
 
 import httpx
 from fastapi import APIRouter, Request
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from loguru import logger
+from starlette.background import BackgroundTask
 
 router = APIRouter()
 
 AUTH_API_BASE = "http://localhost:4000"
 
-_client: httpx.AsyncClient | None = None
+# Hop-by-hop headers that must not be relayed. Request names are compared
+# against Starlette's raw (already lowercased) header bytes.
+_REQ_HOP = frozenset(
+    {
+        b"host",
+        b"transfer-encoding",
+        b"connection",
+        b"keep-alive",
+        b"proxy-authenticate",
+        b"proxy-authorization",
+        b"te",
+        b"trailers",
+        b"upgrade",
+    }
+)
+_RESP_HOP = frozenset(
+    {"transfer-encoding", "connection", "keep-alive", "content-length"}
+)
+
 
+def create_auth_client() -> httpx.AsyncClient:
+    """
+    Build the shared client used to reach the auth-api.
 
-def _get_client() -> httpx.AsyncClient:
-    global _client
-    if _client is None or _client.is_closed:
-        _client = httpx.AsyncClient(base_url=AUTH_API_BASE, timeout=30.0)
-    return _client
+    Created once in the app lifespan and stored on ``app.state.auth_client`` so
+    keep-alive connections are reused across requests instead of reconnecting.
+    """
+    return httpx.AsyncClient(
+        base_url=AUTH_API_BASE,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=1000),
+    )
 
 
 @router.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"])
 async def proxy_auth(request: Request, path: str):
     """Forward any request to the internal auth-api service."""
-    client = _get_client()
+    client: httpx.AsyncClient = request.app.state.auth_client
 
     target_url = f"/{path}"
     if request.url.query:
         target_url = f"{target_url}?{request.url.query}"
 
     # Forward headers, excluding hop-by-hop headers
-    excluded_headers = {"host", "transfer-encoding", "connection"}
-    headers = {
-        k: v
-        for k, v in request.headers.items()
-        if k.lower() not in excluded_headers
-    }
+    headers = [(k, v) for k, v in request.headers.raw if k not in _REQ_HOP]
 
-    body = await request.body()
+    # Stream the request body straight to the upstream socket instead of
+    # buffering it. A forwarded content-length keeps httpx from chunking it.
+    content_length = request.headers.get("content-length")
+    has_body = (
+        content_length not in (None, "0")
+        or "transfer-encoding" in request.headers
+    )
 
+    upstream_request = client.build_request(
+        request.method,
+        target_url,
+        headers=headers,
+        content=request.stream() if has_body else None,
+    )
     try:
-        resp = await client.request(
-            method=request.method,
-            url=target_url,
-            headers=headers,
-            content=body,
-        )
+        resp = await client.send(upstream_request, stream=True)
     except httpx.ConnectError:
         logger.error("Auth-api is not reachable at {}", AUTH_API_BASE)
-        return Response(
-            content='{"error":"Auth service unavailable"}',
-            status_code=503,
-            media_type="application/json",
-        )
+        return JSONResponse({"error": "Auth service unavailable"}, status_code=503)
 
-    # Forward response headers, excluding hop-by-hop
-    response_headers = {
-        k: v
-        for k, v in resp.headers.items()
-        if k.lower() not in {"transfer-encoding", "connection", "content-encoding", "content-length"}
-    }
+    # Forward response headers, excluding hop-by-hop. The body is relayed
+    # raw (still compressed), so content-encoding must be kept. Headers are
+    # kept as a list so repeated ones (e.g. several Set-Cookie) all survive.
+    response_headers = [
+        (k, v) for k, v in resp.headers.multi_items() if k not in _RESP_HOP
+    ]
 
-    return Response(
-        content=resp.content,
-        status_code=resp.status_code,
-        headers=response_headers,
-        media_type=resp.headers.get("content-type"),
-    )
+    if resp.status_code == 304:
+        # Conditional GET hit: validators (etag, cache-control, ...) pass
+        # through, and there is no body to relay.
+        await resp.aclose()
+        response = Response(status_code=304)
+    else:
+        response = StreamingResponse(
+            resp.aiter_raw(),
+            status_code=resp.status_code,
+            background=BackgroundTask(resp.aclose),
+        )
+        if resp.headers.get("content-type", "").startswith("text/event-stream"):
+            # Stop nginx from re-buffering server-sent events
+            response_headers.append(("x-accel-buffering", "no"))
+
+    for key, value in response_headers:
+        response.headers.append(key, value)
+    return response
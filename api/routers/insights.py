@@ -6,7 +6,7 @@ from loguru import logger
 from api.auth import get_user_id
 from api.models import NoteResponse, SaveAsNoteRequest, SourceInsightResponse
 from open_notebook.domain.notebook import SourceInsight
-from open_notebook.exceptions import InvalidInputError
+from open_notebook.exceptions import InvalidInputError, NotFoundError
 
 router = APIRouter()
 
@@ -18,18 +18,13 @@ async def get_insight(
 ):
     """Get a specific insight by ID."""
     try:
-        insight = await SourceInsight.get(insight_id)
-        if not insight:
-            raise HTTPException(status_code=404, detail="Insight not found")
+        insight, source_id = await SourceInsight.get_with_source(insight_id)
         if user_id and insight.user_id != user_id:
             raise HTTPException(status_code=403, detail="Not authorized to view this insight")
 
-        # Get source ID from the insight relationship
-        source = await insight.get_source()
-
         return SourceInsightResponse(
             id=insight.id or "",
-            source_id=source.id or "",
+            source_id=source_id,
             insight_type=insight.insight_type,
             content=insight.content,
             created=str(insight.created),
@@ -37,6 +32,8 @@ async def get_insight(
         )
     except HTTPException:
         raise
+    except NotFoundError:
+        raise HTTPException(status_code=404, detail="Insight not found")
     except Exception as e:
         logger.error(f"Error fetching insight {insight_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Error fetching insight")
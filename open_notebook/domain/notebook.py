@@ -10,7 +10,11 @@ from surrealdb import RecordID
 
 from open_notebook.database.repository import ensure_record_id, repo_query
 from open_notebook.domain.base import ObjectModel
-from open_notebook.exceptions import DatabaseOperationError, InvalidInputError
+from open_notebook.exceptions import (
+    DatabaseOperationError,
+    InvalidInputError,
+    NotFoundError,
+)
 
 
 class Notebook(ObjectModel):
@@ -263,6 +267,23 @@ class SourceInsight(ObjectModel):
     content: str
     user_id: Optional[str] = None
 
+    @classmethod
+    async def get_with_source(cls, id: str) -> Tuple["SourceInsight", str]:
+        """Fetch an insight and the ID of its source in a single query."""
+        if not id:
+            raise InvalidInputError("ID cannot be empty")
+        try:
+            result = await repo_query(
+                "SELECT * FROM $id", {"id": ensure_record_id(id)}
+            )
+        except Exception as e:
+            logger.error(f"Error fetching insight {id}: {str(e)}")
+            logger.exception(e)
+            raise DatabaseOperationError(e)
+        if not result:
+            raise NotFoundError(f"source_insight with id {id} not found")
+        return cls(**result[0]), str(result[0].get("source") or "")
+
     async def get_source(self) -> "Source":
         try:
             src = await repo_query(
@@ -278,14 +299,54 @@ class SourceInsight(ObjectModel):
             raise DatabaseOperationError(e)
 
     async def save_as_note(self, notebook_id: Optional[str] = None) -> Any:
-        source = await self.get_source()
-        note = Note(
-            title=f"{self.insight_type} from source {source.title}",
-            content=self.content,
-        )
-        await note.save()
-        if notebook_id:
-            await note.add_to_notebook(notebook_id)
+        """
+        Create a note from this insight, optionally linked to a notebook.
+
+        The source title lookup, note creation and notebook relation run as
+        one statement, so they commit together in a single round trip.
+        """
+        if not self.content or not self.content.strip():
+            raise InvalidInputError("Note content cannot be empty")
+        try:
+            result = await repo_query(
+                """
+                RETURN {
+                    LET $source_title = (SELECT VALUE source.title FROM ONLY $insight_id);
+                    LET $note = (CREATE ONLY note CONTENT {
+                        title: string::concat($insight_type, " from source ", $source_title ?? ""),
+                        content: $content,
+                    });
+                    IF $notebook_id {
+                        LET $note_id = $note.id;
+                        RELATE $note_id->artifact->$notebook_id;
+                    };
+                    RETURN $note;
+                };
+                """,
+                {
+                    "insight_id": ensure_record_id(self.id),
+                    "insight_type": self.insight_type,
+                    "content": self.content,
+                    "notebook_id": (
+                        ensure_record_id(notebook_id) if notebook_id else None
+                    ),
+                },
+            )
+        except Exception as e:
+            logger.error(f"Error saving insight {self.id} as note: {str(e)}")
+            logger.exception(e)
+            raise DatabaseOperationError(e)
+
+        note = Note(**(result[0] if isinstance(result, list) else result))
+
+        # Submit embedding command (fire-and-forget), as Note.save() does
+        if note.id:
+            command_id = submit_command(
+                "open_notebook",
+                "embed_note",
+                {"note_id": str(note.id)},
+            )
+            logger.debug(f"Submitted embed_note command {command_id} for {note.id}")
         return note
 
 
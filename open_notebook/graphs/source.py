@@ -1,9 +1,20 @@
+import asyncio
+import glob
+import math
 import operator
+import os
 import re
-from typing import Any, Dict, List, Optional
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from content_core import extract_content
 from content_core.common import ProcessSourceState
+from content_core.config import get_audio_concurrency
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Send
@@ -11,22 +22,217 @@ from loguru import logger
 from typing_extensions import Annotated, TypedDict
 
 from open_notebook.ai.models import Model, ModelManager
-from open_notebook.domain.content_settings import ContentSettings
 from open_notebook.domain.notebook import Asset, Source
 from open_notebook.domain.transformation import Transformation
 from open_notebook.graphs.transformation import graph as transform_graph
 
+_YT_RE = re.compile(
+    r"(?:https?://)?(?:www\.)?"
+    r"(?:youtu\.be/|youtube\.com(?:/embed/|/v/|/watch\?v=|/watch\?.+&v=))"
+    r"[\w-]{11}"
+)
+
+# Extraction engines passed to content-core. Plain constants rather than a
+# ContentSettings instance: that model is a process-wide singleton, and
+# constructing it here would overwrite the user's saved settings.
+_URL_ENGINE = "auto"
+_DOCUMENT_ENGINE = "auto"
+
+# Default speech-to-text model as (provider, name), cached briefly so batch
+# ingestion does not re-read the defaults and model record for every source.
+# The graph also runs under asyncio.run() in worker threads, so the cache is
+# guarded by a thread lock that is never held across an await; a duplicate
+# lookup on a cold cache is harmless.
+_STT_CACHE_TTL_S = 60.0
+_stt_cache: Tuple[float, Optional[Tuple[str, str]]] = (0.0, None)
+_stt_cache_lock = threading.Lock()
+
+# Concurrent speech-to-text requests per transcription, by provider, for the
+# YouTube fallback. STT_CONCURRENCY overrides these for every provider; other
+# providers use content-core's own audio concurrency setting. All values are
+# capped at content-core's limit for transcribe_audio_segment.
+_STT_CONCURRENCY_BY_PROVIDER = {"google": 3, "openai": 8, "groq": 10}
+_MAX_STT_CONCURRENCY = 10
+
+# Length of each audio segment sent to speech-to-text (10 minutes)
+_SEGMENT_LENGTH_S = 10 * 60
+# Dedicated, bounded pool for blocking media work (downloads, ffmpeg), so
+# concurrent ingests don't crowd out the loop's default executor. It lives
+# for the whole process and only starts threads when work is submitted.
+_MEDIA_POOL = ThreadPoolExecutor(
+    max_workers=max(2, (os.cpu_count() or 1) // 2), thread_name_prefix="stt-media"
+)
+# Caps ffmpeg range encoders process-wide: each split runs its own encoder
+# threads, and several splits can run at once on the media pool.
+_FFMPEG_ENCODERS = threading.BoundedSemaphore(os.cpu_count() or 1)
+_DURATION_RE = re.compile(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+
+
+def _stt_concurrency(provider: str) -> int:
+    """Number of segments to transcribe at once for a speech-to-text provider."""
+    override = os.getenv("STT_CONCURRENCY")
+    if override:
+        try:
+            value = int(override)
+            if value >= 1:
+                return min(value, _MAX_STT_CONCURRENCY)
+        except ValueError:
+            pass
+        logger.warning(f"Ignoring invalid STT_CONCURRENCY: '{override}'")
+    if provider in _STT_CONCURRENCY_BY_PROVIDER:
+        return _STT_CONCURRENCY_BY_PROVIDER[provider]
+    return get_audio_concurrency()
+
+
+def _ffmpeg_bin() -> str:
+    """Locate ffmpeg on PATH, falling back to the imageio-ffmpeg binary."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        return ffmpeg
+    try:
+        import imageio_ffmpeg
+
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return "ffmpeg"
+
+
+def _cpu_count() -> int:
+    """Number of CPUs, for sizing parallel ffmpeg work."""
+    return os.cpu_count() or 1
+
+
+def _run_ffmpeg(args: List[str]) -> None:
+    """Run ffmpeg quietly with the given arguments, raising on failure."""
+    subprocess.run(
+        [_ffmpeg_bin(), "-nostdin", "-y", "-loglevel", "error", *args],
+        check=True,
+        capture_output=True,
+        timeout=1800,
+    )
+
+
+def _probe_duration_s(audio_path: str) -> Optional[float]:
+    """Read the media duration from ffmpeg's input banner, if it reports one."""
+    result = subprocess.run(
+        [_ffmpeg_bin(), "-nostdin", "-hide_banner", "-i", audio_path],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    match = _DURATION_RE.search(result.stderr)
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def _encode_audio_range(
+    audio_path: str, start_s: float, length_s: float, output_path: str
+) -> str:
+    """Encode one time range of the input to mp3."""
+    with _FFMPEG_ENCODERS:
+        _run_ffmpeg(
+            [
+                "-ss",
+                str(start_s),
+                "-t",
+                str(length_s),
+                "-i",
+                audio_path,
+                "-vn",
+                "-c:a",
+                "libmp3lame",
+                "-b:a",
+                "96k",
+                output_path,
+            ]
+        )
+    return output_path
+
+
+def _split_audio_sync(audio_path: str, temp_dir: str) -> List[str]:
+    """
+    Split audio into 10-minute mp3 segments; blocking, run in a worker thread.
+
+    Long audio is cut into ranges encoded by parallel ffmpeg processes, one
+    per core, since libmp3lame encodes on a single thread. Audio that fits in
+    one segment, or whose duration cannot be probed, goes through a single
+    ffmpeg segment-muxer pass instead.
+    """
+    duration_s = _probe_duration_s(audio_path)
+    workers = _cpu_count()
+
+    if duration_s and duration_s > _SEGMENT_LENGTH_S and workers > 1:
+        num_segments = math.ceil(duration_s / _SEGMENT_LENGTH_S)
+        logger.info(
+            f"Audio is {duration_s:.0f}s, splitting into {num_segments} segments"
+        )
+        # The work happens in ffmpeg subprocesses, so threads are enough to
+        # keep one encoder running per core.
+        with ThreadPoolExecutor(max_workers=min(workers, num_segments)) as pool:
+            futures = [
+                pool.submit(
+                    _encode_audio_range,
+                    audio_path,
+                    i * _SEGMENT_LENGTH_S,
+                    _SEGMENT_LENGTH_S,
+                    os.path.join(temp_dir, f"segment_{i:03d}.mp3"),
+                )
+                for i in range(num_segments)
+            ]
+            return [future.result() for future in futures]
+
+    _run_ffmpeg(
+        [
+            "-i",
+            audio_path,
+            "-vn",
+            "-f",
+            "segment",
+            "-segment_time",
+            str(_SEGMENT_LENGTH_S),
+            "-reset_timestamps",
+            "1",
+            "-c:a",
+            "libmp3lame",
+            "-b:a",
+            "96k",
+            os.path.join(temp_dir, "segment_%03d.mp3"),
+        ]
+    )
+    output_files = sorted(glob.glob(os.path.join(temp_dir, "segment_*.mp3")))
+    logger.info(f"Split audio into {len(output_files)} segments")
+    return output_files
+
 
 def _is_youtube_url(url: str) -> bool:
     """Check if a URL is a YouTube video URL."""
-    if not url:
-        return False
-    youtube_regex = (
-        r"(?:https?://)?(?:www\.)?"
-        r"(?:youtu\.be/|youtube\.com(?:/embed/|/v/|/watch\?v=|/watch\?.+&v=))"
-        r"[\w-]{11}"
+    # Cheap substring check first: most URLs are not YouTube at all
+    return (
+        bool(url)
+        and ("youtu.be" in url or "youtube.com" in url)
+        and _YT_RE.search(url) is not None
     )
-    return bool(re.search(youtube_regex, url))
+
+
+async def _get_stt_model_config() -> Optional[Tuple[str, str]]:
+    """Return the default speech-to-text (provider, model name), if any."""
+    global _stt_cache
+    with _stt_cache_lock:
+        fetched_at, config = _stt_cache
+    if fetched_at and time.monotonic() - fetched_at < _STT_CACHE_TTL_S:
+        return config
+
+    config = None
+    defaults = await ModelManager().get_defaults()
+    if defaults.default_speech_to_text_model:
+        stt_model = await Model.get(defaults.default_speech_to_text_model)
+        if stt_model:
+            config = (stt_model.provider, stt_model.name)
+    with _stt_cache_lock:
+        _stt_cache = (time.monotonic(), config)
+    return config
 
 
 class SourceState(TypedDict):
@@ -45,46 +251,20 @@ class TransformationState(TypedDict):
 
 
 async def content_process(state: SourceState) -> dict:
-    content_settings = ContentSettings(
-        default_content_processing_engine_doc="auto",
-        default_content_processing_engine_url="auto",
-        default_embedding_option="ask",
-        auto_delete_files="yes",
-        youtube_preferred_languages=[
-            "en",
-            "ta",
-            "pt",
-            "es",
-            "de",
-            "nl",
-            "en-GB",
-            "fr",
-            "hi",
-            "ja",
-        ],
-    )
     content_state: Dict[str, Any] = state["content_state"]  # type: ignore[assignment]
 
-    content_state["url_engine"] = (
-        content_settings.default_content_processing_engine_url or "auto"
-    )
-    content_state["document_engine"] = (
-        content_settings.default_content_processing_engine_doc or "auto"
-    )
+    content_state["url_engine"] = _URL_ENGINE
+    content_state["document_engine"] = _DOCUMENT_ENGINE
     content_state["output_format"] = "markdown"
 
     # Add speech-to-text model configuration from Default Models
     try:
-        model_manager = ModelManager()
-        defaults = await model_manager.get_defaults()
-        if defaults.default_speech_to_text_model:
-            stt_model = await Model.get(defaults.default_speech_to_text_model)
-            if stt_model:
-                content_state["audio_provider"] = stt_model.provider
-                content_state["audio_model"] = stt_model.name
-                logger.debug(
-                    f"Using speech-to-text model: {stt_model.provider}/{stt_model.name}"
-                )
+        stt_config = await _get_stt_model_config()
+        if stt_config:
+            provider, model_name = stt_config
+            content_state["audio_provider"] = provider
+            content_state["audio_model"] = model_name
+            logger.debug(f"Using speech-to-text model: {provider}/{model_name}")
     except Exception as e:
         logger.warning(f"Failed to retrieve speech-to-text model configuration: {e}")
         # Continue without custom audio model (content-core will use its default)
@@ -115,177 +295,226 @@ async def content_process(state: SourceState) -> dict:
     return {"content_state": processed_state}
 
 
-async def _youtube_stt_fallback(url: str, content_state: dict) -> Optional[str]:
+def _yt_dlp_bin() -> str:
+    """Prefer the yt-dlp installed next to this interpreter, else use PATH."""
+    yt_dlp_bin = os.path.join(os.path.dirname(sys.executable), "yt-dlp")
+    return yt_dlp_bin if os.path.exists(yt_dlp_bin) else "yt-dlp"
+
+
+async def _stream_youtube_segments(url: str, temp_dir: str) -> List[str]:
     """
-    Download YouTube audio and transcribe it using the configured STT model.
-    Used as a fallback when YouTube captions are unavailable.
+    Pipe yt-dlp's audio download straight into the ffmpeg segment muxer.
+
+    Avoids writing the full download to disk and reading it back, and
+    overlaps encoding with the download. Returns the segment paths, or an
+    empty list (with partial output removed) if either process fails.
     """
-    import asyncio
-    import math
-    import os
-    import tempfile
+    read_fd, write_fd = os.pipe()
+    try:
+        yt_dlp = await asyncio.create_subprocess_exec(
+            _yt_dlp_bin(),
+            "-f",
+            "bestaudio",
+            "-o",
+            "-",
+            "--no-playlist",
+            "--quiet",
+            "--no-progress",
+            "--retries",
+            "10",
+            "--socket-timeout",
+            "30",
+            url,
+            stdout=write_fd,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            ffmpeg = await asyncio.create_subprocess_exec(
+                _ffmpeg_bin(),
+                "-y",
+                "-loglevel",
+                "error",
+                "-i",
+                "pipe:0",
+                "-vn",
+                "-f",
+                "segment",
+                "-segment_time",
+                str(_SEGMENT_LENGTH_S),
+                "-reset_timestamps",
+                "1",
+                "-c:a",
+                "libmp3lame",
+                "-b:a",
+                "96k",
+                os.path.join(temp_dir, "segment_%03d.mp3"),
+                stdin=read_fd,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except BaseException:
+            yt_dlp.kill()
+            await yt_dlp.wait()
+            raise
+    except (FileNotFoundError, PermissionError) as e:
+        logger.warning(f"Streaming audio pipeline unavailable: {e}")
+        return []
+    finally:
+        # The children hold their own copies of the pipe ends
+        os.close(read_fd)
+        os.close(write_fd)
 
-    from esperanto import AIFactory
+    try:
+        (_, yt_dlp_err), (_, ffmpeg_err) = await asyncio.wait_for(
+            asyncio.gather(yt_dlp.communicate(), ffmpeg.communicate()),
+            timeout=1800,  # 30 min max
+        )
+    except asyncio.TimeoutError:
+        for proc in (yt_dlp, ffmpeg):
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+        yt_dlp_err, ffmpeg_err = b"timed out", b""
+
+    output_files = sorted(glob.glob(os.path.join(temp_dir, "segment_*.mp3")))
+    if yt_dlp.returncode == 0 and ffmpeg.returncode == 0 and output_files:
+        logger.info(f"Streamed audio into {len(output_files)} segments")
+        return output_files
+
+    logger.warning(
+        f"Streaming audio pipeline failed (yt-dlp: {yt_dlp.returncode}, "
+        f"ffmpeg: {ffmpeg.returncode}): "
+        f"{(yt_dlp_err or ffmpeg_err).decode(errors='replace').strip()}"
+    )
+    for f in output_files:
+        os.remove(f)
+    return []
 
-    # Download audio from YouTube using pytubefix
-    from pytubefix import YouTube
 
-    logger.info(f"Downloading audio from YouTube: {url}")
+def _download_youtube_audio(url: str, temp_dir: str) -> Optional[str]:
+    """Download YouTube audio to temp_dir, returning the file path on success."""
+    audio_path = os.path.join(temp_dir, "audio.mp4")
 
-    # Use a persistent temp directory (NOT with-block to avoid premature cleanup)
-    temp_dir = tempfile.mkdtemp()
+    # Try pytubefix first with retries, fall back to yt-dlp
+    download_success = False
     try:
-        audio_path = os.path.join(temp_dir, "audio.mp4")
+        from pytubefix import YouTube
 
-        # Try pytubefix first with retries, fall back to yt-dlp
-        download_success = False
-        try:
-            from pytubefix import YouTube
+        yt = YouTube(url)
+        audio_stream = (
+            yt.streams.filter(only_audio=True).order_by("abr").desc().first()
+        )
+        if audio_stream:
+            audio_path = audio_stream.download(
+                output_path=temp_dir,
+                filename="audio.mp4",
+                max_retries=5,
+                timeout=600,
+            )
+            download_success = True
+            logger.info(
+                f"Downloaded audio via pytubefix: {audio_path} "
+                f"({os.path.getsize(audio_path)} bytes)"
+            )
+        else:
+            logger.warning("No audio stream found via pytubefix.")
+    except Exception as e:
+        logger.warning(f"pytubefix download failed: {e}. Trying yt-dlp...")
 
-            yt = YouTube(url)
-            audio_stream = (
-                yt.streams.filter(only_audio=True).order_by("abr").desc().first()
+    if not download_success:
+        # Fallback to yt-dlp (more reliable for large/throttled videos)
+        try:
+            yt_dlp_path = os.path.join(temp_dir, "audio.%(ext)s")
+            result = subprocess.run(
+                [
+                    _yt_dlp_bin(),
+                    "-f",
+                    "bestaudio",
+                    "-o",
+                    yt_dlp_path,
+                    "--no-playlist",
+                    "--retries",
+                    "10",
+                    "--socket-timeout",
+                    "30",
+                    url,
+                ],
+                capture_output=True,
+                text=True,
+                timeout=1800,  # 30 min max
             )
-            if audio_stream:
-                audio_path = audio_stream.download(
-                    output_path=temp_dir,
-                    filename="audio.mp4",
-                    max_retries=5,
-                    timeout=600,
-                )
-                download_success = True
-                logger.info(
-                    f"Downloaded audio via pytubefix: {audio_path} "
-                    f"({os.path.getsize(audio_path)} bytes)"
-                )
+            if result.returncode == 0:
+                # Find the downloaded file
+                for f in os.listdir(temp_dir):
+                    if f.startswith("audio."):
+                        audio_path = os.path.join(temp_dir, f)
+                        download_success = True
+                        break
+                if download_success:
+                    logger.info(
+                        f"Downloaded audio via yt-dlp: {audio_path} "
+                        f"({os.path.getsize(audio_path)} bytes)"
+                    )
+                else:
+                    logger.error("yt-dlp succeeded but no audio file found.")
             else:
-                logger.warning("No audio stream found via pytubefix.")
+                logger.error(f"yt-dlp failed: {result.stderr}")
+        except FileNotFoundError:
+            logger.error("yt-dlp not installed. Install with: pip install yt-dlp")
         except Exception as e:
-            logger.warning(f"pytubefix download failed: {e}. Trying yt-dlp...")
+            logger.error(f"yt-dlp fallback failed: {e}")
 
-        if not download_success:
-            # Fallback to yt-dlp (more reliable for large/throttled videos)
-            try:
-                import subprocess
-                import sys
+    if not download_success or not os.path.exists(audio_path):
+        return None
+    return audio_path
 
-                yt_dlp_bin = os.path.join(
-                    os.path.dirname(sys.executable), "yt-dlp"
-                )
-                if not os.path.exists(yt_dlp_bin):
-                    yt_dlp_bin = "yt-dlp"  # try PATH
-
-                yt_dlp_path = os.path.join(temp_dir, "audio.%(ext)s")
-                result = subprocess.run(
-                    [
-                        yt_dlp_bin,
-                        "-f",
-                        "bestaudio",
-                        "-o",
-                        yt_dlp_path,
-                        "--no-playlist",
-                        "--retries",
-                        "10",
-                        "--socket-timeout",
-                        "30",
-                        url,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=1800,  # 30 min max
-                )
-                if result.returncode == 0:
-                    # Find the downloaded file
-                    for f in os.listdir(temp_dir):
-                        if f.startswith("audio."):
-                            audio_path = os.path.join(temp_dir, f)
-                            download_success = True
-                            break
-                    if download_success:
-                        logger.info(
-                            f"Downloaded audio via yt-dlp: {audio_path} "
-                            f"({os.path.getsize(audio_path)} bytes)"
-                        )
-                    else:
-                        logger.error("yt-dlp succeeded but no audio file found.")
-                else:
-                    logger.error(f"yt-dlp failed: {result.stderr}")
-            except FileNotFoundError:
-                logger.error(
-                    "yt-dlp not installed. Install with: pip install yt-dlp"
-                )
-            except Exception as e:
-                logger.error(f"yt-dlp fallback failed: {e}")
 
-        if not download_success or not os.path.exists(audio_path):
-            logger.error("Failed to download YouTube audio via all methods.")
-            return None
+async def _youtube_stt_fallback(url: str, content_state: dict) -> Optional[str]:
+    """
+    Download YouTube audio and transcribe it using the configured STT model.
+    Used as a fallback when YouTube captions are unavailable.
+    """
+    import tempfile
 
-        logger.info(
-            f"Audio ready: {audio_path} ({os.path.getsize(audio_path)} bytes)"
-        )
+    from esperanto import AIFactory
 
-        # Get STT model from content_state or default
-        audio_provider = content_state.get("audio_provider")
-        audio_model = content_state.get("audio_model")
+    # Get STT model from content_state or default
+    audio_provider = content_state.get("audio_provider")
+    audio_model = content_state.get("audio_model")
 
-        if audio_provider and audio_model:
-            stt_model = AIFactory.create_speech_to_text(
-                audio_provider, audio_model, {"timeout": 3600}
-            )
-        else:
-            logger.error("No STT model configured. Cannot transcribe audio.")
-            return None
+    if audio_provider and audio_model:
+        stt_model = AIFactory.create_speech_to_text(
+            audio_provider, audio_model, {"timeout": 3600}
+        )
+    else:
+        logger.error("No STT model configured. Cannot transcribe audio.")
+        return None
 
-        # Split audio into segments using thread pool to avoid blocking event loop
-        from content_core.processors.audio import transcribe_audio_segment
-        from moviepy import AudioFileClip
+    from content_core.processors.audio import transcribe_audio_segment
 
-        def _split_audio_sync(audio_path: str, temp_dir: str) -> list:
-            """Split audio into segments synchronously in a worker thread."""
-            audio_clip = AudioFileClip(audio_path)
-            duration_s = audio_clip.duration
-            audio_clip.close()
+    logger.info(f"Downloading audio from YouTube: {url}")
 
-            segment_length_s = 10 * 60  # 10 minutes
-            output_files = []
+    # Use a persistent temp directory (NOT with-block to avoid premature cleanup)
+    temp_dir = tempfile.mkdtemp()
+    try:
+        # Stream yt-dlp straight into ffmpeg; fall back to downloading to disk
+        output_files = await _stream_youtube_segments(url, temp_dir)
+
+        if not output_files:
+            # Download and split on the media pool so they don't block the loop
+            loop = asyncio.get_running_loop()
+            audio_path = await loop.run_in_executor(
+                _MEDIA_POOL, _download_youtube_audio, url, temp_dir
+            )
+            if not audio_path:
+                logger.error("Failed to download YouTube audio via all methods.")
+                return None
 
-            if duration_s > segment_length_s:
-                num_segments = math.ceil(duration_s / segment_length_s)
-                logger.info(
-                    f"Audio is {duration_s:.0f}s, splitting into {num_segments} segments"
-                )
-                for i in range(num_segments):
-                    start = i * segment_length_s
-                    end = min((i + 1) * segment_length_s, duration_s)
-                    seg_path = os.path.join(temp_dir, f"segment_{i:03d}.mp3")
-
-                    # Use moviepy directly for reliable segment extraction
-                    clip = AudioFileClip(audio_path)
-                    segment = clip.subclipped(start, end)
-                    segment.write_audiofile(seg_path, codec="mp3", logger=None)
-                    segment.close()
-                    clip.close()
-
-                    output_files.append(seg_path)
-                    logger.debug(
-                        f"Created segment {i + 1}/{num_segments}: {seg_path}"
-                    )
-            else:
-                # Convert to mp3 for Google STT compatibility
-                mp3_path = os.path.join(temp_dir, "audio.mp3")
-                clip = AudioFileClip(audio_path)
-                clip.write_audiofile(mp3_path, codec="mp3", logger=None)
-                clip.close()
-                output_files = [mp3_path]
-
-            return output_files
-
-        # Run splitting in thread pool so it doesn't interfere with async
-        loop = asyncio.get_event_loop()
-        output_files = await loop.run_in_executor(
-            None, _split_audio_sync, audio_path, temp_dir
-        )
+            logger.info(
+                f"Audio ready: {audio_path} ({os.path.getsize(audio_path)} bytes)"
+            )
+            output_files = await loop.run_in_executor(
+                _MEDIA_POOL, _split_audio_sync, audio_path, temp_dir
+            )
 
         # Verify all segment files exist before transcription
         for f in output_files:
@@ -296,37 +525,41 @@ async def _youtube_stt_fallback(url: str, content_state: dict) -> Optional[str]:
             f"All {len(output_files)} segments ready. Starting transcription..."
         )
 
-        # Transcribe segments sequentially to handle errors gracefully
-        # and save partial results if quota is exceeded
+        # Transcribe segments concurrently; transcribe_audio_segment holds the
+        # semaphore itself, which bounds the requests in flight
+        semaphore = asyncio.Semaphore(_stt_concurrency(audio_provider))
+        results = await asyncio.gather(
+            *[
+                transcribe_audio_segment(audio_file, stt_model, semaphore)
+                for audio_file in output_files
+            ],
+            return_exceptions=True,
+        )
+
+        # Walk results in order so partial transcripts stay contiguous
         transcriptions: list[str] = []
         failed_count = 0
-        semaphore = asyncio.Semaphore(3)
-
-        for i, audio_file in enumerate(output_files):
-            try:
-                text = await transcribe_audio_segment(
-                    audio_file, stt_model, semaphore
-                )
-                transcriptions.append(text)
-                logger.debug(
-                    f"Transcribed segment {i + 1}/{len(output_files)} "
-                    f"({len(text)} chars)"
-                )
-            except Exception as e:
+        for i, text in enumerate(results):
+            if isinstance(text, BaseException):
                 failed_count += 1
                 logger.warning(
-                    f"Failed to transcribe segment {i + 1}/{len(output_files)}: {e}"
+                    f"Failed to transcribe segment {i + 1}/{len(output_files)}: {text}"
                 )
-                # If we have at least some transcriptions, continue collecting
-                # what we can. If the error is quota-related, subsequent will
-                # also fail so we break.
-                error_str = str(e).lower()
+                # A quota/rate error means the remaining segments are
+                # unreliable too, so keep only what came before it.
+                error_str = str(text).lower()
                 if "quota" in error_str or "rate" in error_str:
                     logger.warning(
                         f"Quota/rate limit hit after {len(transcriptions)} "
                         f"segments. Saving partial results."
                     )
                     break
+                continue
+            transcriptions.append(text)
+            logger.debug(
+                f"Transcribed segment {i + 1}/{len(output_files)} "
+                f"({len(text)} chars)"
+            )
 
         if not transcriptions:
             logger.error("No segments were successfully transcribed.")
@@ -352,7 +585,6 @@ async def _youtube_stt_fallback(url: str, content_state: dict) -> Optional[str]:
         return None
     finally:
         # Clean up temp directory
-        import shutil
         try:
             shutil.rmtree(temp_dir, ignore_errors=True)
         except Exception:
@@ -0,0 +1,243 @@
+"""
+Unit tests for the /auth reverse proxy router.
+
+The upstream auth-api is replaced with an httpx.MockTransport bound to
+app.state.auth_client, mirroring how the lifespan wires the real client.
+"""
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers import auth_proxy
+from api.routers.auth_proxy import AUTH_API_BASE, create_auth_client
+
+
+async def _stream(body: bytes):
+    """Yield a body as an unread stream, like a real upstream socket."""
+    yield body
+
+
+@pytest.fixture
+def upstream_requests():
+    return []
+
+
+@pytest.fixture
+def client(upstream_requests):
+    """Test client whose auth-api upstream is an in-memory mock transport."""
+    from api.main import app
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        upstream_requests.append(request)
+        if request.url.path == "/events":
+            return httpx.Response(
+                200,
+                content=_stream(b"data: ping\n\n"),
+                headers={"content-type": "text/event-stream"},
+            )
+        if request.url.path == "/gzipped":
+            return httpx.Response(
+                200,
+                content=_stream(gzip.compress(b'{"ok":true}')),
+                headers={
+                    "content-type": "application/json",
+                    "content-encoding": "gzip",
+                },
+            )
+        if request.url.path == "/login":
+            return httpx.Response(
+                200,
+                content=_stream(b'{"ok":true}'),
+                headers=[
+                    ("content-type", "application/json"),
+                    ("set-cookie", "a=1; Path=/"),
+                    ("set-cookie", "b=2; Path=/"),
+                ],
+            )
+        if request.url.path == "/down":
+            raise httpx.ConnectError("connection refused", request=request)
+        if request.url.path == "/me":
+            etag = '"v1"'
+            if request.headers.get("if-none-match") == etag:
+                return httpx.Response(304, headers={"etag": etag})
+            return httpx.Response(
+                200,
+                content=_stream(b'{"id":1}'),
+                headers={"content-type": "application/json", "etag": etag},
+            )
+        if request.url.path == "/echo":
+            return httpx.Response(
+                200,
+                content=_stream(request.read()),
+                headers={"content-type": "application/octet-stream"},
+            )
+        return httpx.Response(
+            200,
+            content=_stream(json.dumps({"path": request.url.path}).encode()),
+            headers={"content-type": "application/json"},
+        )
+
+    app.state.auth_client = httpx.AsyncClient(
+        base_url=AUTH_API_BASE, transport=httpx.MockTransport(handler)
+    )
+    return TestClient(app)
+
+
+@pytest.fixture
+def auth_server():
+    """Real keep-alive HTTP server on an ephemeral port that counts sockets."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+        connections = 0
+
+        def setup(self):
+            super().setup()
+            Handler.connections += 1
+
+        def do_GET(self):
+            body = b'{"ok":true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, Handler
+    server.shutdown()
+    server.server_close()
+
+
+class TestAuthClient:
+    """Test suite for the shared auth-api client."""
+
+    def test_create_auth_client_config(self):
+        """Test the shared client targets the auth-api with bounded timeouts."""
+        auth_client = create_auth_client()
+
+        assert str(auth_client.base_url).rstrip("/") == AUTH_API_BASE
+        assert auth_client.timeout.connect == 5.0
+        assert auth_client.timeout.read == 30.0
+
+    @pytest.mark.asyncio
+    async def test_proxy_reuses_upstream_connections(self, auth_server):
+        """Test sequential proxied requests share keep-alive sockets."""
+        server, handler = auth_server
+        proxy_app = FastAPI()
+        proxy_app.include_router(auth_proxy.router, prefix="/auth")
+        auth_client = create_auth_client()
+        auth_client.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        proxy_app.state.auth_client = auth_client
+
+        async with (
+            auth_client,
+            httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=proxy_app), base_url="http://test"
+            ) as client,
+        ):
+            for _ in range(100):
+                response = await client.get("/auth/health")
+                assert response.json() == {"ok": True}
+
+        assert handler.connections <= 2
+
+
+class TestProxyAuth:
+    """Test suite for request forwarding."""
+
+    def test_proxy_forwards_path_and_query(self, client, upstream_requests):
+        """Test path and query string are forwarded to the auth-api."""
+        response = client.get("/auth/users/me?expand=1")
+
+        assert response.status_code == 200
+        assert response.json() == {"path": "/users/me"}
+        assert upstream_requests[0].url.params["expand"] == "1"
+
+    def test_proxy_relays_compressed_body(self, client):
+        """Test upstream-compressed bodies are relayed with their encoding."""
+        response = client.get("/auth/gzipped")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json() == {"ok": True}
+
+    def test_proxy_disables_buffering_for_event_streams(self, client):
+        """Test server-sent events are marked as unbuffered for nginx."""
+        response = client.get("/auth/events")
+
+        assert response.headers["x-accel-buffering"] == "no"
+        assert response.text == "data: ping\n\n"
+
+    def test_proxy_streams_request_body(self, client, upstream_requests):
+        """Test uploads are forwarded intact with their content-length."""
+        payload = b"x" * 200_000
+        response = client.post("/auth/echo", content=payload)
+
+        assert response.content == payload
+        assert upstream_requests[0].headers["content-length"] == str(len(payload))
+        assert "transfer-encoding" not in upstream_requests[0].headers
+
+    def test_proxy_sends_no_body_for_empty_requests(self, client, upstream_requests):
+        """Test bodiless requests are not forwarded as chunked uploads."""
+        client.get("/auth/health")
+
+        assert "transfer-encoding" not in upstream_requests[0].headers
+        assert upstream_requests[0].read() == b""
+
+    def test_proxy_strips_hop_by_hop_headers(self, client, upstream_requests):
+        """Test hop-by-hop headers are dropped while others are forwarded."""
+        client.get(
+            "/auth/health",
+            headers={
+                "Authorization": "Bearer token",
+                "Proxy-Authorization": "Basic abc",
+                "Upgrade": "websocket",
+            },
+        )
+
+        forwarded = upstream_requests[0].headers
+        assert forwarded["authorization"] == "Bearer token"
+        assert "proxy-authorization" not in forwarded
+        assert "upgrade" not in forwarded
+        assert forwarded["host"] == "localhost:4000"
+
+    def test_proxy_passes_through_conditional_get(self, client):
+        """Test ETags are forwarded and upstream 304s return no body."""
+        first = client.get("/auth/me")
+        assert first.status_code == 200
+        assert first.headers["etag"] == '"v1"'
+
+        second = client.get("/auth/me", headers={"If-None-Match": '"v1"'})
+        assert second.status_code == 304
+        assert second.headers["etag"] == '"v1"'
+        assert second.content == b""
+
+    def test_proxy_reports_unreachable_auth_api(self, client):
+        """Test a refused upstream connection returns a JSON 503."""
+        response = client.get("/auth/down")
+
+        assert response.status_code == 503
+        assert response.json() == {"error": "Auth service unavailable"}
+
+    def test_proxy_keeps_repeated_response_headers(self, client):
+        """Test every Set-Cookie header from the auth-api reaches the client."""
+        response = client.post("/auth/login")
+
+        assert response.headers.get_list("set-cookie") == [
+            "a=1; Path=/",
+            "b=2; Path=/",
+        ]
+        assert response.headers["content-type"] == "application/json"
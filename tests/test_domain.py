@@ -5,6 +5,7 @@ This test suite focuses on validation logic, business rules, and data structures
 that can be tested without database mocking.
 """
 
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -13,11 +14,18 @@ import pytest
 from pydantic import ValidationError
 
 from open_notebook.ai.models import ModelManager
+from open_notebook.database.repository import ensure_record_id, repo_query
 from open_notebook.domain.base import RecordModel
 from open_notebook.domain.content_settings import ContentSettings
-from open_notebook.domain.notebook import Asset, Note, Notebook, Source
+from open_notebook.domain.notebook import (
+    Asset,
+    Note,
+    Notebook,
+    Source,
+    SourceInsight,
+)
 from open_notebook.domain.transformation import Transformation
-from open_notebook.exceptions import InvalidInputError
+from open_notebook.exceptions import InvalidInputError, NotFoundError
 from open_notebook.podcasts.models import EpisodeProfile, SpeakerProfile
 
 # ============================================================================
@@ -394,5 +402,106 @@ class TestEpisodeProfile:
         assert profile.num_segments == 5
 
 
+# ============================================================================
+# TEST SUITE 10: Source Insight Domain
+# ============================================================================
+
+
+class TestSourceInsightDomain:
+    """Test suite for SourceInsight lookups."""
+
+    @pytest.mark.asyncio
+    @patch("open_notebook.domain.notebook.repo_query", new_callable=AsyncMock)
+    async def test_get_with_source_single_query(self, mock_repo_query):
+        """Test insight and source ID are returned from one query."""
+        mock_repo_query.return_value = [
+            {
+                "id": "source_insight:abc",
+                "source": "source:xyz",
+                "insight_type": "summary",
+                "content": "Insight text",
+            }
+        ]
+
+        insight, source_id = await SourceInsight.get_with_source("source_insight:abc")
+
+        assert mock_repo_query.await_count == 1
+        assert insight.id == "source_insight:abc"
+        assert insight.content == "Insight text"
+        assert source_id == "source:xyz"
+
+    @pytest.mark.asyncio
+    @patch("open_notebook.domain.notebook.repo_query", new_callable=AsyncMock)
+    async def test_get_with_source_not_found(self, mock_repo_query):
+        """Test a missing insight raises NotFoundError."""
+        mock_repo_query.return_value = []
+
+        with pytest.raises(NotFoundError):
+            await SourceInsight.get_with_source("source_insight:missing")
+
+    @pytest.mark.asyncio
+    @patch("open_notebook.domain.notebook.submit_command")
+    @patch("open_notebook.domain.notebook.repo_query", new_callable=AsyncMock)
+    async def test_save_as_note_single_query(self, mock_repo_query, mock_submit):
+        """Test the note and notebook link are created in one round trip."""
+        mock_repo_query.return_value = {
+            "id": "note:new",
+            "title": "summary from source Paper",
+            "content": "Insight text",
+        }
+        insight = SourceInsight(
+            id="source_insight:abc", insight_type="summary", content="Insight text"
+        )
+
+        note = await insight.save_as_note("notebook:abc")
+
+        assert mock_repo_query.await_count == 1
+        query_vars = mock_repo_query.await_args.args[1]
+        assert query_vars["notebook_id"].table_name == "notebook"
+        assert note.id == "note:new"
+        assert note.title == "summary from source Paper"
+        mock_submit.assert_called_once_with(
+            "open_notebook", "embed_note", {"note_id": "note:new"}
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(
+        os.getenv("RUN_SURREAL_TESTS") != "1",
+        reason="writes to the configured SurrealDB; set RUN_SURREAL_TESTS=1",
+    )
+    @patch("open_notebook.domain.notebook.submit_command")
+    async def test_save_as_note_against_surrealdb(self, mock_submit):
+        """Test the save_as_note query on a real SurrealDB (opt-in)."""
+        source = await repo_query("CREATE ONLY source CONTENT { title: 'Paper' }")
+        notebook = await repo_query("CREATE ONLY notebook CONTENT { name: 'Test' }")
+        insight = await repo_query(
+            "CREATE ONLY source_insight CONTENT "
+            "{ source: type::thing($source), insight_type: 'summary', "
+            "content: 'Insight text' }",
+            {"source": source["id"]},
+        )
+        ids = [source["id"], notebook["id"], insight["id"]]
+        try:
+            linked_note = await SourceInsight(**insight).save_as_note(notebook["id"])
+            ids.append(linked_note.id)
+            loose_note = await SourceInsight(**insight).save_as_note()
+            ids.append(loose_note.id)
+
+            for note in (linked_note, loose_note):
+                assert note.title == "summary from source Paper"
+                assert note.content == "Insight text"
+            linked = await repo_query(
+                "SELECT VALUE out FROM artifact WHERE in IN $notes",
+                {"notes": [ensure_record_id(n) for n in ids[3:]]},
+            )
+            assert linked == [notebook["id"]]
+        finally:
+            await repo_query(
+                "DELETE artifact WHERE out = type::thing($notebook); "
+                "FOR $id IN $ids { DELETE type::thing($id); };",
+                {"notebook": notebook["id"], "ids": ids},
+            )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -5,11 +5,21 @@ This test suite focuses on testing graph structures, tools, and validation
 without heavy mocking of the actual processing logic.
 """
 
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
 from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+import open_notebook.graphs.source as source_graph_module
 from open_notebook.graphs.prompt import PatternChainState, graph
+from open_notebook.graphs.source import _is_youtube_url
 from open_notebook.graphs.tools import get_current_timestamp
 from open_notebook.graphs.transformation import (
     TransformationState,
@@ -151,5 +161,300 @@ class TestTransformationGraph:
         assert hasattr(transformation_graph, "ainvoke")
 
 
+# ============================================================================
+# TEST SUITE 4: Source Graph Helpers
+# ============================================================================
+
+
+class TestSourceGraphHelpers:
+    """Test suite for source graph helper functions."""
+
+    def test_is_youtube_url_matches_video_urls(self):
+        """Test common YouTube video URL shapes are recognized."""
+        assert _is_youtube_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        assert _is_youtube_url("https://youtu.be/dQw4w9WgXcQ")
+        assert _is_youtube_url("youtube.com/embed/dQw4w9WgXcQ")
+        assert _is_youtube_url(
+            "https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ"
+        )
+
+    def test_is_youtube_url_rejects_other_urls(self):
+        """Test non-video and non-YouTube URLs are rejected."""
+        assert not _is_youtube_url("")
+        assert not _is_youtube_url("https://example.com/watch?v=dQw4w9WgXcQ")
+        assert not _is_youtube_url("https://www.youtube.com/")
+
+    def test_stt_concurrency(self, monkeypatch):
+        """Test STT concurrency uses provider defaults and the env override."""
+        monkeypatch.delenv("STT_CONCURRENCY", raising=False)
+        monkeypatch.setenv("CCORE_AUDIO_CONCURRENCY", "4")
+        assert source_graph_module._stt_concurrency("groq") == 10
+        assert source_graph_module._stt_concurrency("unknown") == 4
+
+        monkeypatch.setenv("STT_CONCURRENCY", "5")
+        assert source_graph_module._stt_concurrency("groq") == 5
+
+        monkeypatch.setenv("STT_CONCURRENCY", "500")
+        assert source_graph_module._stt_concurrency("openai") == 10
+
+        monkeypatch.setenv("STT_CONCURRENCY", "zero")
+        assert source_graph_module._stt_concurrency("google") == 3
+
+    @pytest.mark.asyncio
+    async def test_stt_model_config_is_cached(self, monkeypatch):
+        """Test the default STT model is looked up once within the TTL."""
+        defaults = MagicMock(default_speech_to_text_model="model:stt")
+        stt_model = MagicMock(provider="openai")
+        stt_model.name = "whisper-1"
+        get_defaults = AsyncMock(return_value=defaults)
+        get_model = AsyncMock(return_value=stt_model)
+        monkeypatch.setattr(source_graph_module, "_stt_cache", (0.0, None))
+        monkeypatch.setattr(
+            source_graph_module.ModelManager, "get_defaults", get_defaults
+        )
+        monkeypatch.setattr(source_graph_module.Model, "get", get_model)
+
+        first = await source_graph_module._get_stt_model_config()
+        second = await source_graph_module._get_stt_model_config()
+
+        assert first == second == ("openai", "whisper-1")
+        get_defaults.assert_awaited_once()
+        get_model.assert_awaited_once()
+
+    def test_stt_model_config_across_event_loops(self, monkeypatch):
+        """Test threads running their own event loops share the cache safely."""
+        defaults = MagicMock(default_speech_to_text_model="model:stt")
+        stt_model = MagicMock(provider="openai")
+        stt_model.name = "whisper-1"
+
+        async def get_defaults(self):
+            await asyncio.sleep(0.1)
+            return defaults
+
+        monkeypatch.setattr(source_graph_module, "_stt_cache", (0.0, None))
+        monkeypatch.setattr(
+            source_graph_module.ModelManager, "get_defaults", get_defaults
+        )
+        monkeypatch.setattr(
+            source_graph_module.Model, "get", AsyncMock(return_value=stt_model)
+        )
+        results = []
+
+        def worker():
+            try:
+                results.append(
+                    asyncio.run(
+                        asyncio.wait_for(
+                            source_graph_module._get_stt_model_config(), timeout=2
+                        )
+                    )
+                )
+            except Exception as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [("openai", "whisper-1")] * 3
+
+    @pytest.mark.asyncio
+    async def test_youtube_stt_fallback_stops_at_quota_error(
+        self, monkeypatch, tmp_path
+    ):
+        """Test failed segments are skipped and a quota error truncates."""
+        import content_core.processors.audio as audio_module
+        import esperanto
+        from loguru import logger
+
+        segments = []
+        for i in range(5):
+            segment = tmp_path / f"segment_{i:03d}.mp3"
+            segment.write_bytes(b"")
+            segments.append(str(segment))
+        outcomes = {
+            segments[0]: "one",
+            segments[1]: RuntimeError("decoder failed"),
+            segments[2]: "three",
+            segments[3]: RuntimeError("Quota exceeded for this project"),
+            segments[4]: "five",
+        }
+
+        async def transcribe(audio_file, stt_model, semaphore):
+            outcome = outcomes[audio_file]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(audio_module, "transcribe_audio_segment", transcribe)
+        monkeypatch.setattr(esperanto.AIFactory, "create_speech_to_text", MagicMock())
+        monkeypatch.setattr(
+            source_graph_module,
+            "_stream_youtube_segments",
+            AsyncMock(return_value=segments),
+        )
+        messages = []
+        sink_id = logger.add(messages.append, level="WARNING")
+        try:
+            result = await source_graph_module._youtube_stt_fallback(
+                "https://youtu.be/dQw4w9WgXcQ",
+                {"audio_provider": "openai", "audio_model": "whisper-1"},
+            )
+        finally:
+            logger.remove(sink_id)
+
+        assert result == "one three"
+        assert any("2/5 segments (2 failed)" in m for m in messages)
+
+    @pytest.mark.asyncio
+    async def test_youtube_stt_fallback_uses_media_pool(self, monkeypatch, tmp_path):
+        """Test the download-and-split fallback runs on the media pool threads."""
+        import content_core.processors.audio as audio_module
+        import esperanto
+
+        threads = []
+        audio_path = tmp_path / "audio.m4a"
+        audio_path.write_bytes(b"audio")
+        segment = tmp_path / "segment_000.mp3"
+        segment.write_bytes(b"")
+
+        def download(url, temp_dir):
+            threads.append(threading.current_thread().name)
+            return str(audio_path)
+
+        def split(path, temp_dir):
+            threads.append(threading.current_thread().name)
+            return [str(segment)]
+
+        monkeypatch.setattr(
+            source_graph_module,
+            "_stream_youtube_segments",
+            AsyncMock(return_value=[]),
+        )
+        monkeypatch.setattr(source_graph_module, "_download_youtube_audio", download)
+        monkeypatch.setattr(source_graph_module, "_split_audio_sync", split)
+        monkeypatch.setattr(
+            audio_module, "transcribe_audio_segment", AsyncMock(return_value="text")
+        )
+        monkeypatch.setattr(esperanto.AIFactory, "create_speech_to_text", MagicMock())
+
+        result = await source_graph_module._youtube_stt_fallback(
+            "https://youtu.be/dQw4w9WgXcQ",
+            {"audio_provider": "openai", "audio_model": "whisper-1"},
+        )
+
+        assert result == "text"
+        assert len(threads) == 2
+        assert all(name.startswith("stt-media") for name in threads)
+
+    @pytest.mark.parametrize("cpu_count", [1, 4])
+    def test_split_audio_sync_segments(self, monkeypatch, tmp_path, cpu_count):
+        """Test audio is split into ordered mp3 segments on both code paths."""
+        ffmpeg = source_graph_module._ffmpeg_bin()
+        if not shutil.which(ffmpeg):
+            pytest.skip("ffmpeg not available")
+        audio_path = str(tmp_path / "audio.mp4")
+        tone = ["-f", "lavfi", "-i", "sine=frequency=440:duration=25"]
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", *tone, "-c:a", "aac", audio_path],
+            check=True,
+        )
+        monkeypatch.setattr(source_graph_module, "_SEGMENT_LENGTH_S", 10)
+        monkeypatch.setattr(source_graph_module, "_cpu_count", lambda: cpu_count)
+
+        segments = source_graph_module._split_audio_sync(audio_path, str(tmp_path))
+
+        assert [os.path.basename(f) for f in segments] == [
+            "segment_000.mp3",
+            "segment_001.mp3",
+            "segment_002.mp3",
+        ]
+        assert source_graph_module._probe_duration_s(segments[-1]) < 6
+
+    def test_split_audio_caps_concurrent_encoders(self, monkeypatch, tmp_path):
+        """Test concurrent splits share one process-wide ffmpeg encoder cap."""
+        running = 0
+        peak = 0
+        counter_lock = threading.Lock()
+
+        def fake_run(args):
+            nonlocal running, peak
+            with counter_lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with counter_lock:
+                running -= 1
+
+        monkeypatch.setattr(source_graph_module, "_cpu_count", lambda: 4)
+        monkeypatch.setattr(
+            source_graph_module, "_FFMPEG_ENCODERS", threading.BoundedSemaphore(4)
+        )
+        monkeypatch.setattr(source_graph_module, "_probe_duration_s", lambda p: 80)
+        monkeypatch.setattr(source_graph_module, "_SEGMENT_LENGTH_S", 10)
+        monkeypatch.setattr(source_graph_module, "_run_ffmpeg", fake_run)
+
+        threads = [
+            threading.Thread(
+                target=source_graph_module._split_audio_sync,
+                args=("audio.mp4", str(tmp_path)),
+            )
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script")
+    async def test_stream_youtube_segments(self, monkeypatch, tmp_path):
+        """Test piped downloads are segmented, and failures leave no output."""
+        ffmpeg = source_graph_module._ffmpeg_bin()
+        if not shutil.which(ffmpeg):
+            pytest.skip("ffmpeg not available")
+        audio_path = tmp_path / "audio.aac"
+        tone = ["-f", "lavfi", "-i", "sine=frequency=440:duration=15"]
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", *tone, "-f", "adts", str(audio_path)],
+            check=True,
+        )
+        fake_yt_dlp = tmp_path / "yt-dlp"
+        fake_yt_dlp.write_text(f"#!/bin/sh\ncat {audio_path}\n")
+        fake_yt_dlp.chmod(0o755)
+        failing_yt_dlp = tmp_path / "yt-dlp-failing"
+        failing_yt_dlp.write_text("#!/bin/sh\nexit 1\n")
+        failing_yt_dlp.chmod(0o755)
+        monkeypatch.setattr(source_graph_module, "_SEGMENT_LENGTH_S", 10)
+
+        ok_dir = tmp_path / "ok"
+        ok_dir.mkdir()
+        monkeypatch.setattr(
+            source_graph_module, "_yt_dlp_bin", lambda: str(fake_yt_dlp)
+        )
+        segments = await source_graph_module._stream_youtube_segments(
+            "https://youtu.be/dQw4w9WgXcQ", str(ok_dir)
+        )
+        assert [os.path.basename(f) for f in segments] == [
+            "segment_000.mp3",
+            "segment_001.mp3",
+        ]
+
+        failed_dir = tmp_path / "failed"
+        failed_dir.mkdir()
+        monkeypatch.setattr(
+            source_graph_module, "_yt_dlp_bin", lambda: str(failing_yt_dlp)
+        )
+        segments = await source_graph_module._stream_youtube_segments(
+            "https://youtu.be/dQw4w9WgXcQ", str(failed_dir)
+        )
+        assert segments == []
+        assert list(failed_dir.iterdir()) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])